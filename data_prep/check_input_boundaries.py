@@ -14,10 +14,11 @@
 ##################
 import argparse
 import arcpy
+import numpy as np
 import sys
 
-from collections import defaultdict
-from numpy import average
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 ###################
@@ -40,14 +41,21 @@ RESERVED_WORDS_FILE = r"\\dataserver1\GPW\GPW5\Scripts\Ingest\reference_data\res
 '''  Functions  '''
 ###################
 
-def _read_reserved_words():
-    ''' reads in reserved words (unsupported field names) from the network'''
-    reserved_words = set()
+@lru_cache(maxsize=1)
+def _load_reserved_words():
+    ''' reads the reserved words file from the network, only once per run. Plain
+    file i/o (no arcpy), so it is safe to run on a background thread.'''
+    lines = Path(RESERVED_WORDS_FILE).read_text().splitlines()
+    return frozenset(line.strip() for line in lines)
+
+
+def _read_reserved_words(pending=None):
+    ''' reads in reserved words (unsupported field names) from the network. Optionally
+    takes a future of _load_reserved_words that was started earlier.'''
+    reserved_words = frozenset()
     arcpy.AddMessage('Reading in reserved keywords.')
     try:
-        with open(RESERVED_WORDS_FILE, 'r') as f:
-            for line in f:
-                reserved_words.add(line.strip())
+        reserved_words = pending.result() if pending else _load_reserved_words()
     except IOError:
         arcpy.AddWarning('Unable to read list of reserved keywords, field names cannot be checked!')
         arcpy.AddMessage('Tried to read words from file: ')
@@ -55,6 +63,61 @@ def _read_reserved_words():
     return reserved_words
 
 
+def _fieldnames(fc):
+    ''' returns the field names of a feature class'''
+    return tuple(fld.name for fld in arcpy.ListFields(fc))
+
+
+def _in_sorted(values, sorted_keys):
+    ''' vectorized membership test of values against an already sorted array
+    (a binary search per value, rather than a python set lookup per row)'''
+    if not len(sorted_keys):
+        return np.zeros(len(values), dtype=bool)
+    idx = np.searchsorted(sorted_keys, values)
+    idx = np.minimum(idx, len(sorted_keys) - 1)
+    return sorted_keys[idx] == values
+
+
+def _largest_per_id(ids, areas, oids):
+    ''' returns the oids of the largest polygon (by area) for each id. The records
+    are grouped by sorting on the id, so no per-row python lookups are needed.'''
+    if not len(ids):
+        return oids[:0]
+    order = np.argsort(ids, kind='stable')
+    ids, areas, oids = ids[order], areas[order], oids[order]
+    # start index of each group of identical ids
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(ids)) + 1))
+    max_areas = np.maximum.reduceat(areas, starts)
+    group = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, len(ids))))
+    # keep the first polygon in each group that matches the maximum area
+    is_max = areas == max_areas[group]
+    _, first = np.unique(group[is_max], return_index=True)
+    return oids[is_max][first]
+
+
+def _central_polys(ids, areas, oids, dupe_count):
+    ''' returns the sorted oids of the central (largest) polygon of each group of
+    split polygons, warning if any group was not matched'''
+    # get the areas of the overlaps; largest should be the main poly
+    arcpy.AddMessage('Checking overlap sizes...')
+    main_overlap_polys = np.sort(_largest_per_id(ids, areas, oids))
+    if len(main_overlap_polys) != dupe_count:
+        arcpy.AddWarning('Not all overlap polygons were matched with a central (main) polygon.')
+        arcpy.AddWarning('Overlaps should be manually reviewed.')
+    else:
+        arcpy.AddMessage('Main (central) overlap polygons identified')
+    return main_overlap_polys
+
+
+def _calculate_area(in_features):
+    ''' calculates the geodesic area (square km) of the features into AREA_SQKM'''
+    arcpy.management.CalculateGeometryAttributes(
+        in_features = in_features,
+        geometry_property = [['AREA_SQKM','AREA_GEODESIC']],
+        area_unit = 'SQUARE_KILOMETERS'
+    )
+
+
 def _check_input_params(fc,ows, iso):
     '''check input parameters: feature class, iso, output folder. '''
     if not arcpy.Exists(fc):
@@ -67,10 +130,10 @@ def _check_input_params(fc,ows, iso):
     arcpy.AddMessage("Creating output Geodatabase (if it doesn't exist).")
     out_gdb = f'{iso}_ingest.gdb'
     # convert workspace to full path (if it's a relative path, causes a bug later on)
-    ows = Path(ows).absolute().as_posix()
-    if not arcpy.Exists(rf'{ows}\{out_gdb}'):
-        arcpy.management.CreateFileGDB(ows, out_gdb)
-    return(rf'{ows}\{out_gdb}')
+    gdb_path = Path(ows).absolute() / out_gdb
+    if not arcpy.Exists(str(gdb_path)):
+        arcpy.management.CreateFileGDB(str(gdb_path.parent), out_gdb)
+    return gdb_path
 
 
 def check_iso_code(iso):
@@ -81,35 +144,42 @@ def check_iso_code(iso):
 
     return iso
     
-def check_fields(fc): 
+def check_fields(fc, reserved_words=None): 
     ''' check if any of the fields have a reserved name or invalid starting character'''
     changed_names = {}
-    reserved_words = _read_reserved_words()
-    flds = [fld.name.upper() for fld in arcpy.ListFields(fc)]
+    msgs = []
+    if reserved_words is None:
+        reserved_words = _read_reserved_words()
+    flds = tuple(fld.upper() for fld in _fieldnames(fc))
     arcpy.AddMessage(f'Checking feature class field names: \n{flds}')
-    for fld in flds:
-        if fld in reserved_words:
-            changed_names[fld] = fld + '_'
-            arcpy.AddMessage(f'Field {fld} is a reserved name, adding an underscore.')
     # Rare, but this has happened when OS or custom libraries are used to 
     # write a shapefile from another format and they don't validate field names
     arcpy.AddMessage('Checking for edge cases: digit or underscore starting a field.')
     for fld in flds:
-        if fld[:1].isdigit():
+        # a bad starting character takes precedence over a reserved name
+        if fld[0].isdigit():
             changed_names[fld] = 't_' + fld
-        elif fld[:1] == '_':
+        elif fld[0] == '_':
             changed_names[fld] =  't' + fld
+        elif fld in reserved_words:
+            changed_names[fld] = fld + '_'
+            msgs.append(f'Field {fld} is a reserved name, adding an underscore.')
+    # send the messages in one call rather than one per field
+    if msgs:
+        arcpy.AddMessage('\n'.join(msgs))
     return changed_names
 
 
-def check_geometry(fc):
+def check_geometry(fc, desc=None):
     ''' check that the feature class has valid geometry. Also check the feature type and
-    if a spatial reference is defined.'''
+    if a spatial reference is defined. Pass in desc (from arcpy.da.Describe) to avoid
+    describing the feature class again.'''
     repair_geometry = None
     topology_tests = None
     projection_defined = None
     # get feature class description
-    desc = arcpy.da.Describe(fc)    
+    if desc is None:
+        desc = arcpy.da.Describe(fc)
 
     arcpy.AddMessage('Checking spatial reference...')
     if desc['spatialReference'].name == 'Unknown':
@@ -162,36 +232,57 @@ def make_copy(fc, out_ws, iso, out_sr = None, field_mapping = None):
         arcpy.env.outputCoordinateSystem = out_sr
 
     out_fc = f'{iso}_ingest'
+    out_path = str(Path(out_ws) / out_fc)
     arcpy.AddMessage('Creating working copy of feature class.')
-    arcpy.management.CopyFeatures(fc, rf'{out_ws}\{out_fc}')
-
     if field_mapping:
+        # rename the fields as part of the copy, rather than altering each
+        # field (and rewriting the schema) afterwards
         arcpy.AddMessage('Renaming fields.')
-        arcpy.env.workspace = out_ws
-        for key, value in field_mapping.items():
-            arcpy.management.AlterField(
-                out_fc,
-                key,
-                value,
-            )
+        fms = arcpy.FieldMappings()
+        fms.addTable(fc)
+        renamed = set()
+        for idx in range(fms.fieldCount):
+            fm = fms.getFieldMap(idx)
+            out_field = fm.outputField
+            key = out_field.name.upper()
+            if key in field_mapping:
+                out_field.name = field_mapping[key]
+                fm.outputField = out_field
+                fms.replaceFieldMap(idx, fm)
+                renamed.add(key)
+        # field mappings leave out the oid and geometry fields, and names may not
+        # match exactly (e.g. truncated shapefile names), so flag anything missed
+        not_renamed = set(field_mapping).difference(renamed)
+        if not_renamed:
+            arcpy.AddWarning(f'Could not rename fields: {sorted(not_renamed)}')
+            arcpy.AddWarning('Check the field names in the output feature class.')
+        arcpy.conversion.ExportFeatures(fc, out_path, field_mapping=fms)
+    else:
+        arcpy.management.CopyFeatures(fc, out_path)
+    # make sure union/eliminate can use a spatial index on the working copy
+    if not arcpy.Describe(out_path).hasSpatialIndex:
+        arcpy.management.AddSpatialIndex(out_path)
 
-    return rf'{out_ws}\{out_fc}'
+    return out_path
 
-def overlap_gap_analysis(fc):
-    '''Run union and calculate the number of overlaps and gaps in the features'''
-    arcpy.AddMessage('Creating and populating unique ID field')
-    arcpy.management.AddField(fc, 'union_uid', 'LONG')
-    with arcpy.da.UpdateCursor(fc, 'union_uid') as rows:
-        for i, row in enumerate(rows):
-            row[0] = i+1
-            rows.updateRow(row)
+def overlap_gap_analysis(fc, reuse_area=False):
+    '''Run union and calculate the number of overlaps and gaps in the features. With
+    reuse_area, the AREA_SQKM values of the input are trusted for polygons that the
+    union does not split, and only gaps and split polygons are measured.'''
     original_count = int(arcpy.management.GetCount(fc)[0])
+    # Union keeps the oid of the source polygon in FID_<input name>, which is
+    # used to find split polygons; gaps have no source polygon (-1)
+    uid_fld = f'FID_{arcpy.Describe(fc).baseName}'
     arcpy.AddMessage('Running Union operation.')
-    fc_union = arcpy.analysis.Union(
-        in_features = fc,
-        out_feature_class = fc + '_union',
-        gaps = 'NO_GAPS',
-    )
+    # the union (not a pairwise intersect) is needed: eliminate and the review
+    # map work on the full planar partition of the boundaries. Let it use all
+    # cores where the installed version supports it.
+    with arcpy.EnvManager(parallelProcessingFactor='100%'):
+        fc_union = arcpy.analysis.Union(
+            in_features = fc,
+            out_feature_class = fc + '_union',
+            gaps = 'NO_GAPS',
+        )
     arcpy.AddMessage(f'created {fc_union}')
     post_union_count = int(arcpy.management.GetCount(fc_union)[0])
     if post_union_count > original_count:
@@ -199,113 +290,141 @@ def overlap_gap_analysis(fc):
     else:
         arcpy.AddMessage('No overlaps or gaps found!')
         return fc_union, 0, 0
+    # get a list of the field names to check
+    # when adding new fields for gaps/overlaps
+    flds = [fld.lower() for fld in _fieldnames(fc_union)]
+    if reuse_area and 'area_sqkm' not in flds:
+        arcpy.AddWarning('No AREA_SQKM field to reuse, calculating all areas.')
+        reuse_area = False
+    if not reuse_area:
+        # update the area field before reading, so the union is only read once
+        _calculate_area(fc_union)
     arcpy.AddMessage('Counting overlaps and gaps.')
-    gaps = 0
-    uids = []
-    for row in arcpy.da.SearchCursor(fc_union, 'union_uid'):
-        if not row[0]:
-            gaps += 1
-        else:
-            uids.append(int(row[0]))
-    overlaps = len(uids) - original_count
+    read_flds = ['OID@', uid_fld, 'AREA_SQKM']
+    null_values = {uid_fld: -1, 'AREA_SQKM': -1}
+    arr = arcpy.da.FeatureClassToNumPyArray(fc_union, read_flds, null_value=null_values)
+    # split polys carry the area of their source poly, so every poly that isn't a
+    # gap needs a usable input area
+    if reuse_area and not (arr['AREA_SQKM'][arr[uid_fld] != -1] > 0).all():
+        arcpy.AddWarning('AREA_SQKM has missing or zero values, calculating all areas.')
+        reuse_area = False
+        _calculate_area(fc_union)
+        arr = arcpy.da.FeatureClassToNumPyArray(fc_union, read_flds, null_value=null_values)
+    uids = arr[uid_fld]
+    vals, counts = np.unique(uids, return_counts=True)
+    # gaps have no source polygon
+    gaps = int(counts[vals == -1].sum())
+    overlaps = len(uids) - gaps - original_count
+    # ids that are present more than once (polys split by unions)
+    dupes = vals[(counts > 1) & (vals != -1)]
     arcpy.AddMessage(f'Found {gaps} gaps and {overlaps} overlaps.')
-    if any((overlaps, gaps)):
-        # get a list of the field names to check
-        # when adding new fields for gaps/overlaps
-        flds = [fld.name.lower() for fld in arcpy.ListFields(fc_union)]
-        # update the area field
-        arcpy.management.CalculateGeometryAttributes(
-            in_features = fc_union,
-            geometry_property = [['AREA_SQKM','AREA_GEODESIC']],
-            area_unit = 'SQUARE_KILOMETERS'
-        )
+    # dupes comes out of np.unique, so it's already sorted
+    is_dupe = _in_sorted(uids, dupes)
 
+    # build the flag columns in memory and write them back in a single pass
+    union_oid_fld = arcpy.Describe(fc_union).OIDFieldName
+    columns = [arr['OID@']]
+    names = [union_oid_fld]
     if overlaps > 0:
         arcpy.AddMessage('Flagging overlaps in union of the boundaries.')
-        # get a set of ids that are present more than once (polys split by unions)
-        # this should be more efficient than a counter for large feature classes
-        visited = set()
-        dupes = {x for x in uids if x in visited or visited.add(x)}
-
         if 'overlaps' not in flds:
             arcpy.management.AddField(fc_union, 'overlaps', 'SHORT')
-        # get the areas of the overlaps; largest should be the main poly
-        arcpy.AddMessage('Checking overlap sizes...')
-        overlap_sizes = dict()
-        for x in dupes:
-            overlap_sizes[x] = [0,0]
-        for row in arcpy.da.SearchCursor(fc_union, ['OBJECTID','union_uid', 'AREA_SQKM']):
-            if row[0]: # gaps have no id
-                # add areas to dict by overlap id if it's larger; leaving the largest value
-                # after everything has been parsed. 
-                oid = int(row[0])
-                id = int(row[1])
-                area = float(row[2])
-                if id in dupes: 
-                    if area > overlap_sizes[id][0]:
-                        overlap_sizes[id] = [area,oid]
-            
-        # get a set of the oids of the largest overlap polygons
-        main_overlap_polys = set([x[1] for x in overlap_sizes.values()])
-        if len(main_overlap_polys) != len(dupes):
-            arcpy.AddWarning('Not all overlap polygons were matched with a central (main) polygon.')
-            arcpy.AddWarning('Overlaps should be manually reviewed.')
+        if reuse_area:
+            # the split polys haven't been measured yet, flag them all as overlaps
+            # (1) for now; the central polys are flagged once the areas are known
+            columns.append(is_dupe.astype('i2'))
         else:
-            arcpy.AddMessage('Main (central) overlap polygons identified')
-        arcpy.AddMessage('Updating union feature class to flag overlaps (1) and central polys (2).')
-        with arcpy.da.UpdateCursor(fc_union, ['OBJECTID', 'union_uid', 'overlaps']) as rows:
-            for row in rows:
-                oid = int(row[0])
-                id = int(row[1])
-                # overlaps flagged as 1 or 2
-                if id in dupes:
-                    if oid in main_overlap_polys:
-                        row[2] = 2 # central/main poly
-                    else:
-                        row[2] = 1 # overlap
-                else:
-                    row[2] = 0 # no overlap
-                rows.updateRow(row)
-        
+            main_overlap_polys = _central_polys(
+                uids[is_dupe], arr['AREA_SQKM'][is_dupe], arr['OID@'][is_dupe], len(dupes))
+            is_main = _in_sorted(arr['OID@'], main_overlap_polys)
+            # overlaps flagged as 1 or 2 (central/main poly), 0 for no overlap
+            columns.append(np.where(is_main, 2, np.where(is_dupe, 1, 0)).astype('i2'))
+        names.append('overlaps')
+
     if gaps > 0:
         arcpy.AddMessage('Flagging gaps in union of the boundaries.')
         if 'gaps' not in flds:
             arcpy.management.AddField(fc_union, 'gaps', 'SHORT')
-        with arcpy.da.UpdateCursor(fc_union, ['union_uid', 'gaps']) as rows:
-            for row in rows:
-                if not row[0]:
-                    row[1] = 1 # gap
-                else:
-                    row[1] = 0 # regular or overlap poly
-                rows.updateRow(row)
+        # 1 for gap, 0 for regular or overlap poly
+        columns.append((uids == -1).astype('i2'))
+        names.append('gaps')
+
+    arcpy.AddMessage('Updating union feature class with gap and overlap flags.')
+    arcpy.da.ExtendTable(
+        fc_union,
+        union_oid_fld,
+        np.rec.fromarrays(columns, names=names),
+        union_oid_fld,
+        append_only=False
+    )
+    # index each flag field, for the overlap query below and the eliminate selection
+    arcpy.AddMessage('Indexing gap, overlap and area fields.')
+    for fld in names[1:]:
+        arcpy.management.AddIndex(fc_union, fld, f'{fld}_idx')
+
+    if reuse_area:
+        # polygons that are not split by the union keep the area of their source
+        # polygon; gaps and split polygons are selected with the flags just written,
+        # which is why this path writes the flags before the areas are known
+        arcpy.AddMessage('Reusing input AREA_SQKM values, calculating areas of gaps and split polygons only.')
+        where = ' OR '.join(f'{fld} = 1' for fld in names[1:])
+        lyr = arcpy.management.MakeFeatureLayer(fc_union, 'area_lyr', where)
+        _calculate_area(lyr)
+        arcpy.management.Delete(lyr)
+
+        if overlaps > 0:
+            # only the split polys are read, gaps and regular polys are skipped by
+            # the (indexed) query in the geodatabase rather than in python
+            ovr = arcpy.da.FeatureClassToNumPyArray(
+                fc_union, ['OID@', uid_fld, 'AREA_SQKM'], where_clause='overlaps = 1')
+            main_overlap_polys = _central_polys(
+                ovr[uid_fld], ovr['AREA_SQKM'], ovr['OID@'], len(dupes))
+            is_main = _in_sorted(ovr['OID@'], main_overlap_polys)
+            # rewrite the overlap flag of the split polys only, 2 for central/main poly
+            arcpy.da.ExtendTable(
+                fc_union,
+                union_oid_fld,
+                np.rec.fromarrays(
+                    [ovr['OID@'], np.where(is_main, 2, 1).astype('i2')],
+                    names=[union_oid_fld, 'overlaps']
+                ),
+                union_oid_fld,
+                append_only=False
+            )
+    arcpy.management.AddIndex(fc_union, 'AREA_SQKM', 'area_idx', 'NON_UNIQUE', 'NON_ASCENDING')
 
     return fc_union, gaps, overlaps
 
-def calculate_gap_overlap_stats(polys, check_fields=['gaps','overlaps']):
+def calculate_gap_overlap_stats(polys, check_fields=('gaps','overlaps')):
     '''calculate staistics for gaps and overlaps '''
-    areas = defaultdict(list)
-    poly_area = 0
-    check_fields.append('AREA_SQKM')
-    for row in arcpy.da.SearchCursor(polys, check_fields):
-        for i, fld in enumerate(check_fields[:-1]):
-            if int(row[i]) == 1:
-                areas[fld].append(float(row[-1]))
-            else:
-                poly_area += float(row[-1])
+    if isinstance(check_fields, str):
+        check_fields = [check_fields]
+    check_fields = list(check_fields)
+    arr = arcpy.da.FeatureClassToNumPyArray(
+        polys, check_fields + ['AREA_SQKM'], null_value=0)
+    poly_area = arr['AREA_SQKM']
+    masks = {fld: arr[fld] == 1 for fld in check_fields}
+    flagged = np.logical_or.reduce(list(masks.values()))
     stats = {}
-    stats['average unit area excluding gaps and overlaps'] = average(poly_area)
-    for key, value in areas.items():
-        stats[f'{key} max area'] = max(value)
-        stats[f'{key} mean area'] =  average(value)
+    # counted sum rather than mean(), which warns and returns nan when every
+    # polygon is flagged
+    unit_count = int(np.count_nonzero(~flagged))
+    unit_area = poly_area[~flagged].sum() / unit_count if unit_count else 0.0
+    stats['average unit area excluding gaps and overlaps'] = unit_area
+    for key, mask in masks.items():
+        if mask.any():
+            stats[f'{key} max area'] = poly_area[mask].max()
+            stats[f'{key} mean area'] = poly_area[mask].mean()
     return stats
 
 
-def check_srs(feat):
+def check_srs(feat, desc=None):
     '''check that the data are in geographic coordinates on WGS84 system, 
     and returns booleans representing each respectively. '''
     isGeo = False
     wgs84 = False
-    desc = arcpy.da.Describe(feat)
+    if desc is None:
+        desc = arcpy.da.Describe(feat)
     if desc['spatialReference'].type == 'Geographic':
         isGeo = True
     if desc['spatialReference'].datumCode == 6326:
@@ -331,6 +450,9 @@ if __name__ == '__main__':
         help='Output folder for results (does not have to exist).')
     parser.add_argument('-c', '--check_iso', action='store_true',
         help='Check that ISO code is valid')
+    parser.add_argument('-a', '--reuse_area', action='store_true',
+        help='Trust the AREA_SQKM field of the input (geodesic square km) and only '
+             'calculate areas of gaps and split polygons.')
     # parser.add_argument('-v', '--verbose', action='store_true',
     #     help='Log more verbosely.')
  
@@ -350,18 +472,27 @@ if __name__ == '__main__':
 
 
 
-    arcpy.AddMessage('Checking field names...')
-    updated_names = check_fields(args.input_features)
+    # describe the input once and share it between the geometry and srs checks
+    desc = arcpy.da.Describe(args.input_features)
+
+    # arcpy is not thread safe, so only the reserved words file (plain file i/o on
+    # the network share) is read in the background while the geometry is checked
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        pending_words = ex.submit(_load_reserved_words)
+
+        arcpy.AddMessage('Checking geometry...')
+        repair, topo, has_proj = check_geometry(args.input_features, desc)
+
+        arcpy.AddMessage('Checking field names...')
+        updated_names = check_fields(
+            args.input_features, _read_reserved_words(pending_words))
     if updated_names:
         arcpy.AddMessage('Found fields with reserved words in their names,')
         arcpy.AddMessage('output feature class will have updated names.')
         arcpy.AddMessage('Fields to be changed and the new names are:')
         arcpy.AddMessage(f'{updated_names}')
         arcpy.AddMessage('Field names will be renamed in a copy of the feature class.')
-        
 
-    arcpy.AddMessage('Checking geometry...')
-    repair, topo, has_proj = check_geometry(args.input_features)
     if not has_proj:
         arcpy.AddError('Projection information is missing.')
         arcpy.AddError('Please investigate and define a projection for the feature class!')
@@ -371,7 +502,7 @@ if __name__ == '__main__':
     # check that the data are in geographic on WGS84. If not, pass in our target WGS84 spatial reference
     # to the copy features function so that the data are projected during the copy
     sr = None
-    if not all((check_srs(args.input_features))):
+    if not all((check_srs(args.input_features, desc))):
         sr = arcpy.SpatialReference(4326)
     
 
@@ -390,8 +521,14 @@ if __name__ == '__main__':
         arcpy.AddWarning(f'Repairing geometry for {fc_copy}.')
         arcpy.RepairGeometry_management(fc_copy)
 
+    reuse_area = args.reuse_area
+    if reuse_area and (repair or sr):
+        # input areas don't match repaired or projected geometry
+        arcpy.AddWarning('Geometry was repaired or projected, input areas will not be reused.')
+        reuse_area = False
+
     if topo:
-        fc_unioned, gap_count, overlap_count = overlap_gap_analysis(fc_copy)
+        fc_unioned, gap_count, overlap_count = overlap_gap_analysis(fc_copy, reuse_area)
         if all(x > 0 for x in [gap_count, overlap_count]):
             topo_stats = calculate_gap_overlap_stats(fc_unioned, ['gaps','overlaps'])
         elif gap_count > 0:
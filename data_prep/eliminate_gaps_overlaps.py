@@ -20,13 +20,27 @@ def check_fc(in_fc):
         arcpy.AddError(f"No overlap or gap field found in {in_fc}")
         sys.exit(1)
 
-    return(gaps, overlaps)
+    return(gaps, overlaps, flds)
 
     
-def run_eliminate(fc, where):
+def run_eliminate(fc, where, fields):
     ''' eliminate gaps and overlaps smaller than the maximum area'''
     new_fc = None
 
+    # eliminate is much slower without a spatial index
+    if not arcpy.Describe(fc).hasSpatialIndex:
+        arcpy.AddMessage('Adding spatial index.')
+        arcpy.management.AddSpatialIndex(fc)
+
+    # index the fields used in the selection that aren't already indexed (the
+    # output of check_input_boundaries already has them)
+    flds = {fld.lower(): fld for fld in fields}
+    indexed = {fld.name.lower() for idx in arcpy.ListIndexes(fc) for fld in idx.fields}
+    for key in ('gaps', 'overlaps', 'area_sqkm'):
+        if key in flds and key not in indexed:
+            arcpy.AddMessage(f'Adding attribute index on {flds[key]}.')
+            arcpy.management.AddIndex(fc, flds[key], f'{key}_idx')
+
     # make a feature layer with the selection
     lyr = arcpy.MakeFeatureLayer_management(fc, 'lyr')
     # check the count to make sure something is selected
@@ -51,7 +65,7 @@ if __name__ == '__main__':
 
     args = parser.parse_args()
     arcpy.AddMessage('checking inputs...')
-    g, o = check_fc(args.input_features)
+    g, o, flds = check_fc(args.input_features)
 
     if all((g,o)):
         query = f'(gaps = 1 OR overlaps = 1) AND AREA_SQKM < {args.max_area}'
@@ -61,6 +75,6 @@ if __name__ == '__main__':
         query = f"overlaps = 1 AND AREA_SQKM < {args.max_area}"
     arcpy.AddMessage(f'Where query: {query}')
     arcpy.AddMessage(f'Eliminating polygons from {args.input_features}')
-    run_eliminate(args.input_features, query)
+    run_eliminate(args.input_features, query, flds)
 
 
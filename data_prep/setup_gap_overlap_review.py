@@ -3,6 +3,8 @@ import argparse
 import os
 import sys
 
+from pathlib import PureWindowsPath
+
 # template project
 # TODO: move to network path and reference there
 template = r"F:\GPWv5_prototyping\projects\gaps_overlapps_template\gaps_overlapps_template.aprx"
@@ -12,9 +14,10 @@ original_layer = 'original_loaded'
 def setup_project(fc):
     '''Import layers from template feature class and update source to the input feature class. '''
     aprx = arcpy.mp.ArcGISProject('current')
-    to_path = fc[:fc.rfind('\\')]
-    to_fc = fc[fc.rfind('\\')+1:]
-    if any(isinstance(x, int) for x in (to_fc, to_path)):
+    # parse the path once; handles both back and forward slashes
+    fc_path = PureWindowsPath(fc)
+    to_path, to_fc = str(fc_path.parent), fc_path.name
+    if not fc_path.parent.parts:
         arcpy.AddWarning(f'Cannot find {fc}')
         arcpy.AddError('Please specify full input path to feature class.')
         sys.exit(1)
@@ -45,7 +48,7 @@ def setup_project(fc):
             )
         elif lyr.name == original_layer:
             ## update the original ingest layer if it exists
-            if arcpy.Exists(f'{to_path}/{orig_fc}'):
+            if arcpy.Exists(str(fc_path.parent / orig_fc)):
                 update_dict = {
                     'connection_info': {'database': f'{to_path}'}, 
                     'dataset': f'{orig_fc}', 